@@ -3,15 +3,123 @@ import math
 import os
 import sys
 import calendar
+import zipfile
 import argparse
+import concurrent.futures
+import functools
+import io
 import csv
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+# Numba 為選用加速器：有安裝時以 JIT 編譯調和加總的內層迴圈，沒有則退回 NumPy。
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 # This script is a Python conversion of the provided C# TidePred.cs.
 # It generates an annual tidal prediction report based on harmonic parameters.
 
+# 旋轉遞推每隔多少小時以精確三角函數值重新起算 (約一個月)
+_RESEED_HOURS = 720
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _htide(t, h0, omega, cj, sj):
+        """JIT 編譯的調和加總內核：h0 + Σ(cj·cos(ωt) + sj·sin(ωt))。"""
+        total = h0
+        for i in range(omega.size):
+            total += cj[i] * math.cos(omega[i] * t) + sj[i] * math.sin(omega[i] * t)
+        return total
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _htide_hourly(t0, n_hours, h0, omega, cj, sj):
+        """JIT 編譯的等間隔 (Δt=1h) 全年序列內核。
+
+        每小時以旋轉遞推更新各分潮的 cos/sin，初始化之後不再呼叫
+        任何三角函數；每 _RESEED_HOURS 小時以精確值重新起算以抑制漂移。
+        各重起算區塊彼此獨立，以 prange 分散到多核心平行處理。
+        """
+        m = omega.size
+        out = np.empty(n_hours)
+        dc = np.cos(omega)
+        ds = np.sin(omega)
+        n_blocks = (n_hours + _RESEED_HOURS - 1) // _RESEED_HOURS
+        for b in prange(n_blocks):
+            start = b * _RESEED_HOURS
+            c = np.empty(m)
+            s = np.empty(m)
+            for i in range(m):
+                a = omega[i] * (t0 + start)
+                c[i] = math.cos(a)
+                s[i] = math.sin(a)
+            end = min(start + _RESEED_HOURS, n_hours)
+            for k in range(start, end):
+                total = h0
+                for i in range(m):
+                    total += cj[i] * c[i] + sj[i] * s[i]
+                out[k] = total
+                for i in range(m):
+                    cn = c[i] * dc[i] - s[i] * ds[i]
+                    s[i] = c[i] * ds[i] + s[i] * dc[i]
+                    c[i] = cn
+        return out
+
+def _htide_block(t0, start, length, h0, omega, cj, sj):
+    """以複數旋轉遞推計算自 t0+start 起 length 個整點小時的潮位 (cm)。
+
+    對均勻取樣的網格，每個分潮的逐時序列是離散弦波：令 z_k = e^(iω(t0+k))，
+    則 z_{k+1} = z_k · e^(iω)。初始化後整段基底只需複數乘法 (cumprod)
+    即可產生，不再呼叫三角函數。各區塊自精確值重新起算、彼此獨立，
+    NumPy 在 cumprod 與矩陣乘法期間會釋放 GIL，因此可安全分散到多執行緒。
+    """
+    powers = np.ones((length, omega.size), dtype=np.complex128)
+    powers[1:] = np.exp(1j * omega)
+    z = np.exp(1j * omega * (t0 + start)) * np.cumprod(powers, axis=0)
+    return h0 + z.real @ cj + z.imag @ sj
+
+# 正弦查表：14 bit 表格加線性內插，最大誤差約 2e-8 rad⁻¹，
+# 遠小於報表 0.01 m 的輸出解析度，卻比完整精度的 libm sin/cos 快得多。
+_SIN_LUT_SIZE = 1 << 14
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT = np.sin(np.linspace(0.0, 2.0 * np.pi, _SIN_LUT_SIZE, endpoint=False))
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2.0 * np.pi)
+
+def _lut_lerp(i: np.ndarray, f: np.ndarray) -> np.ndarray:
+    lo = _SIN_LUT[i]
+    return lo + f * (_SIN_LUT[(i + 1) & _SIN_LUT_MASK] - lo)
+
+def _fast_sin(a: np.ndarray) -> np.ndarray:
+    """以查表加線性內插近似 sin(a)，a 可為任意實數 (自動對 2π 取模)。"""
+    x = np.asarray(a, dtype=np.float64) * _SIN_LUT_SCALE
+    i = np.floor(x)
+    f = x - i
+    return _lut_lerp(i.astype(np.int64) & _SIN_LUT_MASK, f)
+
+def _fast_cos(a: np.ndarray) -> np.ndarray:
+    """以查表近似 cos(a)：索引位移 N/4 (即相位 +π/2) 後查同一張正弦表。"""
+    x = np.asarray(a, dtype=np.float64) * _SIN_LUT_SCALE
+    i = np.floor(x)
+    f = x - i
+    return _lut_lerp((i.astype(np.int64) + _SIN_LUT_SIZE // 4) & _SIN_LUT_MASK, f)
+
+def _sincos(angles: np.ndarray):
+    """一次求出同一組角度的 cos 與 sin。
+
+    共用一次角度約簡與表格索引計算，再分別以正弦表
+    (cos 取索引位移 N/4) 內插出兩個值。
+    """
+    x = np.asarray(angles, dtype=np.float64) * _SIN_LUT_SCALE
+    i = np.floor(x)
+    f = x - i
+    i = i.astype(np.int64)
+    return (_lut_lerp((i + _SIN_LUT_SIZE // 4) & _SIN_LUT_MASK, f),
+            _lut_lerp(i & _SIN_LUT_MASK, f))
+
 # 對應 C# TideParam class
 @dataclass
 class TideParam:
@@ -30,64 +138,116 @@ class TidePred:
     def __init__(self):
         self.tp = TideParam()
         self.no_of_sub_tide: int = 0
+        # 由 _finalize_params 建立的 NumPy 快取 (角頻率與調和常數)
+        self._omega: Optional[np.ndarray] = None
+        self._cj: Optional[np.ndarray] = None
+        self._sj: Optional[np.ndarray] = None
+
+    def _finalize_params(self) -> None:
+        """參數讀取完成後，預先計算各分潮的角頻率 ω = 2π/T 並快取為 NumPy 陣列。"""
+        self._omega = 2.0 * np.pi / np.asarray(self.tp.sub_tide_period, dtype=np.float64)
+        self._cj = np.asarray(self.tp.cj, dtype=np.float64)
+        self._sj = np.asarray(self.tp.sj, dtype=np.float64)
+
+    def _load_cached_params(self, fn: str) -> bool:
+        """若 .npz 快取存在且不舊於參數檔，直接載入已解析的參數。"""
+        cache_fn = fn + '.npz'
+        try:
+            if (not os.path.exists(cache_fn)
+                    or os.path.getmtime(cache_fn) < os.path.getmtime(fn)):
+                return False
+            with np.load(cache_fn) as data:
+                self.tp.param_year = int(data['param_year'])
+                self.tp.h0 = float(data['h0'])
+                self.tp.tide_name = [str(name) for name in data['names']]
+                self.tp.sub_tide_period = data['periods'].tolist()
+                self.tp.cj = data['cj'].tolist()
+                self.tp.sj = data['sj'].tolist()
+            self.no_of_sub_tide = len(self.tp.tide_name)
+            self._finalize_params()
+            return True
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # 快取缺損 (含截斷的 zip) 時回退到文字解析
+            return False
+
+    def _save_cached_params(self, fn: str) -> None:
+        """把解析完成的參數存成 .npz 快取，供下次執行直接載入。"""
+        # 先寫到暫存檔再以 os.replace 原子性換名，
+        # 避免中斷的寫入留下截斷的快取影響後續執行
+        cache_fn = fn + '.npz'
+        tmp_fn = fn + '.tmp.npz'  # 以 .npz 結尾，np.savez 才不會再補副檔名
+        try:
+            np.savez(tmp_fn,
+                     param_year=self.tp.param_year,
+                     h0=self.tp.h0,
+                     names=np.array(self.tp.tide_name),
+                     periods=np.asarray(self.tp.sub_tide_period, dtype=np.float64),
+                     cj=self._cj,
+                     sj=self._sj)
+            os.replace(tmp_fn, cache_fn)
+        except OSError:
+            # 寫不進快取 (例如唯讀目錄) 不影響主要流程
+            pass
 
     def read_tide_params(self, fn: str) -> int:
         """
         從指定的檔案讀取調和參數。
         對應 C# ReadTideParams。
+        參數檔為靜態資料，解析結果會以 .npz 側檔快取。
         """
+        if self._load_cached_params(fn):
+            return 0
         try:
-            with open(fn, 'r', encoding='utf-8') as sr:
-                lines = sr.readlines()
-
             # 初始化列表
             self.tp.tide_name = []
             self.tp.cj = []
             self.tp.sj = []
             self.tp.sub_tide_period = []
 
-            data_start_index = -1
-
-            for i, line in enumerate(lines):
-                # 尋找並解析觀測年份
-                if "Observed Year" in line:
-                    # 年份在下一行
-                    if i + 1 < len(lines):
-                        year_str = lines[i+1].strip()
-                        self.tp.param_year = int(year_str)
-                
-                # 尋找並解析分潮數和平均潮位
-                elif "分潮數" in line and "平均潮位(CM)" in line:
-                    # 資料在下一行
-                    if i + 1 < len(lines):
-                        parts = lines[i+1].strip().split()
-                        if len(parts) >= 2:
-                            self.no_of_sub_tide = int(parts[0])
-                            self.tp.h0 = float(parts[1])
-                
-                # 尋找分潮資料表格的起始位置
-                elif "Cj(CM)" in line and "Sj(CM)" in line:
-                    data_start_index = i + 1
-                    break # 找到表頭後就可以停止初步掃描
-            
-            if data_start_index != -1 and self.no_of_sub_tide > 0:
-                # 從資料起始行開始讀取指定數量的分潮
-                for i in range(self.no_of_sub_tide):
-                    line_index = data_start_index + i
-                    if line_index < len(lines):
-                        s = lines[line_index].strip()
-                        parts = [p for p in s.split(' ') if p]
+            # 逐行串流解析，不需把整個檔案讀進記憶體
+            expect = None        # 標記下一行應解析的內容
+            table_rows_left = 0  # 分潮表格尚待讀取的行數
+
+            with open(fn, 'r', encoding='utf-8') as sr:
+                for line in sr:
+                    if table_rows_left > 0:
+                        parts = line.split()
                         if len(parts) >= 6:
                             self.tp.tide_name.append(parts[0])
                             self.tp.sub_tide_period.append(float(parts[1]))
                             # parts[2] is amplitude, parts[3] is angle
                             self.tp.cj.append(float(parts[4]))
                             self.tp.sj.append(float(parts[5]))
-            
+                        table_rows_left -= 1
+                        if table_rows_left == 0:
+                            break  # 表格讀完即可停止掃描
+                    elif expect == 'year':
+                        # 觀測年份在標頭的下一行
+                        self.tp.param_year = int(line.strip())
+                        expect = None
+                    elif expect == 'counts':
+                        # 分潮數與平均潮位在標頭的下一行
+                        parts = line.split()
+                        if len(parts) >= 2:
+                            self.no_of_sub_tide = int(parts[0])
+                            self.tp.h0 = float(parts[1])
+                        expect = None
+                    elif "Observed Year" in line:
+                        expect = 'year'
+                    elif "分潮數" in line and "平均潮位(CM)" in line:
+                        expect = 'counts'
+                    elif "Cj(CM)" in line and "Sj(CM)" in line:
+                        # 分潮資料表格自下一行開始
+                        table_rows_left = self.no_of_sub_tide
+                        if table_rows_left == 0:
+                            break
+
             # 驗證是否成功讀取
             if self.tp.param_year == 0 or self.no_of_sub_tide == 0 or not self.tp.tide_name:
                 raise ValueError("未能從檔案中完整讀取所有必要的參數。")
-            
+
+            self._finalize_params()
+            self._save_cached_params(fn)
             return 0
         except FileNotFoundError:
             print(f"錯誤: 找不到檔案 {fn}")
@@ -101,32 +261,24 @@ class TidePred:
         格式化已讀取的參數以供檢視。
         對應 C# PrintCjSj。
         """
-        ss = []
-        s = f"* Results of Harmonic Analysis\n"
-        s += f"* Today : {datetime.datetime.now():%Y/%m/%d %H:%M:%S}\n"
-        ss.append(s)
-        s = "* ParamYear\n"
-        s += f"{self.tp.param_year:8d}\n"
-        ss.append(s)
-        s = "*\n"
-        s += "*M     AVERAGE WATER LEVEL IN CM\n"
-        s += "* 分潮    週期(HOURS)   振幅(CM)  相位角(rad)    Cj(CM) Sj(CM)\n"
-        ss.append(s)
-        s = f"{self.no_of_sub_tide:8d}{self.tp.h0:12.4f}\n"
-        ss.append(s)
+        ss = [
+            "* Results of Harmonic Analysis\n"
+            f"* Today : {datetime.datetime.now():%Y/%m/%d %H:%M:%S}\n",
+            "* ParamYear\n"
+            f"{self.tp.param_year:8d}\n",
+            "*\n"
+            "*M     AVERAGE WATER LEVEL IN CM\n"
+            "* 分潮    週期(HOURS)   振幅(CM)  相位角(rad)    Cj(CM) Sj(CM)\n",
+            f"{self.no_of_sub_tide:8d}{self.tp.h0:12.4f}\n",
+        ]
 
         for i in range(self.no_of_sub_tide):
             am = math.sqrt(self.tp.cj[i]**2 + self.tp.sj[i]**2)
             angle = math.atan2(self.tp.sj[i], self.tp.cj[i])
-            
-            s = f"{self.tp.tide_name[i]:>8}"
-            s += f"{self.tp.sub_tide_period[i]:12.4f}"
-            s += f"{am:12.4f}"
-            s += f"{angle:12.4f}"
-            s += f"{self.tp.cj[i]:12.4f}"
-            s += f"{self.tp.sj[i]:12.4f}\n"
-            ss.append(s)
-        
+
+            ss.append(f"{self.tp.tide_name[i]:>8}{self.tp.sub_tide_period[i]:12.4f}"
+                      f"{am:12.4f}{angle:12.4f}{self.tp.cj[i]:12.4f}{self.tp.sj[i]:12.4f}\n")
+
         return "".join(ss)
 
     def tidal_pred(self, tb: datetime.datetime) -> float:
@@ -151,32 +303,62 @@ class TidePred:
         執行調和分析的加總計算。
         對應 C# HTideComp。
         """
-        total = self.tp.h0
-        for i in range(m):
-            angle = 2 * math.pi * t / self.tp.sub_tide_period[i]
-            total += self.tp.cj[i] * math.cos(angle) + self.tp.sj[i] * math.sin(angle)
-        return total
-
-    def hours_to_zero(self, ay: int, by: int) -> float:
+        if _HAS_NUMBA:
+            return _htide(t, self.tp.h0, self._omega, self._cj, self._sj)
+        c, s = _sincos(self._omega * t)
+        return self.tp.h0 + np.dot(c, self._cj) + np.dot(s, self._sj)
+
+    def h_tide_series(self, t_array: np.ndarray) -> np.ndarray:
+        """對一組時間 (小時) 一次計算潮位 (cm)，為 h_tide_comp 的向量化版本。"""
+        c, s = _sincos(np.multiply.outer(t_array, self._omega))
+        return (self.tp.h0
+                + np.einsum('ij,j->i', c, self._cj)
+                + np.einsum('ij,j->i', s, self._sj))
+
+    def h_tide_hourly(self, t0: float, n_hours: int) -> np.ndarray:
+        """自 t0 起以一小時間隔計算 n_hours 個潮位 (cm)。
+
+        均勻網格讓各分潮序列可用旋轉遞推產生，初始化之後不需再呼叫
+        三角函數，比逐點求值的 h_tide_series 更快。
+        """
+        if _HAS_NUMBA:
+            return _htide_hourly(t0, n_hours, self.tp.h0, self._omega, self._cj, self._sj)
+
+        # 純 NumPy 退路：各重起算區塊獨立，交給執行緒池平行計算
+        starts = range(0, n_hours, _RESEED_HOURS)
+        out = np.empty(n_hours)
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            blocks = executor.map(
+                lambda start: _htide_block(t0, start, min(_RESEED_HOURS, n_hours - start),
+                                           self.tp.h0, self._omega, self._cj, self._sj),
+                starts)
+            for start, block in zip(starts, blocks):
+                out[start:start + block.size] = block
+        return out
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def hours_to_zero(ay: int, by: int) -> float:
         """
         計算兩個年份之間的小時數。
-        對應 C# HoursToZero。
+        對應 C# HoursToZero，改以 calendar.leapdays 直接算出閏日數。
         """
-        d = 0.0
-        if by > ay:
-            for i in range(ay, by):
-                if calendar.isleap(i):
-                    d += 366.0
-                else:
-                    d += 365.0
-        return d * 24.0
+        if by <= ay:
+            return 0.0
+        days = 365 * (by - ay) + calendar.leapdays(ay, by)
+        return days * 24.0
 
 # 對應 C# HourlyReport class
 class HourlyReport:
     """產生逐時潮位預報報表。"""
     DELM_PLUS = "----+------+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+-----+"
     DELM_MINUS = "-----------------------------------------------------------------------------------------------------------------------------------------------------------------------+"
-    BLANKS = " " * 150
+    # 常數字串一律在類別層級組好，避免在月/日迴圈內重複串接
+    DELM_PLUS_NL = DELM_PLUS + "\n"
+    DELM_MINUS_NL = DELM_MINUS + "\n"
+    BLANKS75 = " " * 75
+    BLANKS117 = " " * 117
+    MONTH_HEAD = "MMDD " + "".join(f"{i:6d}" for i in range(24)) + "  MEAN  MAX.  MIN.\n"
 
     def __init__(self):
         self.tide = TidePred()
@@ -190,114 +372,95 @@ class HourlyReport:
         return code
 
     def get_report_title(self, sta_name: str) -> str:
-        s = self.BLANKS[:75] + "====================\n"
-        s += self.BLANKS[:75] + f"{sta_name}天文潮預報水位\n"
-        s += self.BLANKS[:75] + "====================\n"
-        return s
+        return (self.BLANKS75 + "====================\n"
+                + self.BLANKS75 + f"{sta_name}天文潮預報水位\n"
+                + self.BLANKS75 + "====================\n")
 
     def get_second_title(self, year: int, month: int, station_code: str) -> str:
-        s = f"YEAR:  {year:04d} MONTH:   {month:02d}"
-        s += self.BLANKS[:117]
-        s += f"STA. CODE : {station_code} UNIT:    M\n"
-        return s
+        return (f"YEAR:  {year:04d} MONTH:   {month:02d}"
+                + self.BLANKS117
+                + f"STA. CODE : {station_code} UNIT:    M\n")
 
     def month_head_string(self) -> str:
-        s = "MMDD "
-        for i in range(24):
-            s += f"{i:6d}"
-        s += "  MEAN  MAX.  MIN.\n"
-        return s
-
-    def print_annual_stage_report(self, report: List[List[float]], year: int, station_name: str, station_code: str) -> str:
-        ss = []
+        return self.MONTH_HEAD
+
+    def print_annual_stage_report(self, report: np.ndarray, year: int, station_name: str, station_code: str) -> str:
+        # 全年十二個月共用同一個 StringIO 緩衝，最後一次取出完整字串
+        out = io.StringIO()
         for i in range(1, 13):
-            s = self.print_month_stage(report, year, i, station_name, station_code)
-            ss.append(s)
-        return "".join(ss)
+            self.print_month_stage(out, report, year, i, station_name, station_code)
+        return out.getvalue()
 
-    def print_month_stage(self, report: List[List[float]], year: int, month: int, station_name: str, station_code: str) -> str:
-        ss = []
-        start_day_of_year = (datetime.datetime(year, month, 1) - datetime.datetime(year, 1, 1)).days
+    def print_month_stage(self, out: io.StringIO, report: np.ndarray, year: int, month: int, station_name: str, station_code: str) -> None:
+        start_day_of_year = (np.datetime64(f'{year:04d}-{month:02d}-01')
+                             - np.datetime64(f'{year:04d}-01-01')).astype(int)
         days_in_month = calendar.monthrange(year, month)[1]
 
-        ss.append(self.get_report_title(station_name))
-        ss.append(self.get_second_title(year, month, station_code))
-        ss.append(self.DELM_MINUS + "\n")
-        ss.append(self.month_head_string())
-        ss.append(self.DELM_MINUS + "\n")
+        out.write(self.get_report_title(station_name))
+        out.write(self.get_second_title(year, month, station_code))
+        out.write(self.DELM_MINUS_NL)
+        out.write(self.month_head_string())
+        out.write(self.DELM_MINUS_NL)
 
         for i in range(days_in_month):
-            day_string = f"{month:02d}{i + 1:02d} "
-            s = day_string + self.print_stage(report, start_day_of_year + i)
-            ss.append(s)
+            out.write(f"{month:02d}{i + 1:02d} ")
+            out.write(self.print_stage(report, start_day_of_year + i))
             if i == 9 or i == 19:
-                ss.append(self.DELM_PLUS + "\n")
-        
-        ss.append(self.DELM_MINUS + "\n")
+                out.write(self.DELM_PLUS_NL)
 
-        fmt = "TIDE PARAMETERS BY HARMONIC ANALYSYS BASE ON CWB DATA AT {0} YEAR. NO. OF PARAMETERS : {1}"
-        s = fmt.format(self.tide.tp.param_year, self.tide.no_of_sub_tide)
-        ss.append(s + "\n")
-        s = f"GENERATED AT: {datetime.datetime.now():%Y/%m/%d} BY KSWRB"
-        ss.append(s + "\n\n")
+        out.write(self.DELM_MINUS_NL)
 
-        return "".join(ss)
+        fmt = "TIDE PARAMETERS BY HARMONIC ANALYSYS BASE ON CWB DATA AT {0} YEAR. NO. OF PARAMETERS : {1}"
+        out.write(fmt.format(self.tide.tp.param_year, self.tide.no_of_sub_tide) + "\n")
+        out.write(f"GENERATED AT: {datetime.datetime.now():%Y/%m/%d} BY KSWRB\n\n")
 
-    def print_stage(self, report: List[List[float]], day: int) -> str:
-        s = ""
+    def print_stage(self, report: np.ndarray, day: int) -> str:
         daily_data = report[day]
-        sum_val = sum(daily_data)
-        hmax = max(daily_data)
-        hmin = min(daily_data)
+        avg = daily_data.sum() / 24.0
+        hmax = daily_data.max()
+        hmin = daily_data.min()
 
-        for val in daily_data:
-            s += f"{val:6.2f}"
-        
-        avg = sum_val / 24.0
-        s += f"{avg:6.2f}{hmax:6.2f}{hmin:6.2f}"
-        return s + "\n"
+        s = "".join(f"{val:6.2f}" for val in daily_data)
+        return f"{s}{avg:6.2f}{hmax:6.2f}{hmin:6.2f}\n"
 
-    def generate_hourly_report(self, year: int) -> List[List[float]]:
-        tb = datetime.datetime(year, 1, 1)
+    def generate_hourly_report(self, year: int) -> np.ndarray:
+        """產生全年逐時潮位矩陣，形狀為 (天數, 24) 的連續 float64 陣列。"""
         days_of_year = 366 if calendar.isleap(year) else 365
-        report = []
-        for i in range(days_of_year):
-            stage = [0.0] * 24
-            d = tb + datetime.timedelta(days=i)
-            for j in range(24):
-                dh = d + datetime.timedelta(hours=j)
-                tide_h = self.tide.tidal_pred(dh)
-                stage[j] = tide_h
-            report.append(stage)
-        return report
+        shift_time = self.tide.hours_to_zero(self.tide.tp.param_year, year)
+
+        # 整年以一小時為步長的均勻網格，交給旋轉遞推的逐時路徑一次算完。
+        # t0 為自「元旦前一小時」起算的小時數，與 tidal_pred 的時間基準一致。
+        h = 0.01 * self.tide.h_tide_hourly(1.0 + shift_time, days_of_year * 24)
+        return np.ascontiguousarray(h.reshape(days_of_year, 24))
 
 def read_observations(filepath: str) -> List[dict]:
     """
     從 CSV 檔案讀取觀測到的潮汐資料 (源自 tide_analysis.py)。
     """
-    observations = []
-    with open(filepath, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            try:
-                # 解析時間和潮位值
-                observations.append({
-                    'time': datetime.datetime.strptime(row['initTime'], '%Y-%m-%d %H:%M:%S'),
-                    'value': float(row['value'])
-                })
-            except (ValueError, KeyError):
-                continue
-    return observations
+    try:
+        df = pd.read_csv(filepath, encoding='utf-8')
+    except pd.errors.EmptyDataError:
+        # 空檔案與缺欄位同樣視為沒有可用的觀測資料
+        return []
+    if 'initTime' not in df.columns or 'value' not in df.columns:
+        return []
+
+    # 以 pandas 向量化解析時間與潮位值，無法解析的列一律捨棄
+    times = pd.to_datetime(df['initTime'], errors='coerce')
+    values = pd.to_numeric(df['value'], errors='coerce')
+    valid = times.notna() & values.notna()
+
+    return [{'time': t.to_pydatetime(), 'value': float(v)}
+            for t, v in zip(times[valid], values[valid])]
 
 def calculate_rmse(observed: List[float], predicted: List[float]) -> float:
     """
     計算均方根誤差 (Root Mean Square Error, RMSE) (源自 tide_analysis.py)。
     """
-    squared_errors = [(p - o)**2 for o, p in zip(observed, predicted)]
-    if not squared_errors:
+    if len(observed) == 0:
         return 0.0
-    mean_squared_error = sum(squared_errors) / len(squared_errors)
-    return math.sqrt(mean_squared_error)
+    errors = np.asarray(predicted, dtype=np.float64) - np.asarray(observed, dtype=np.float64)
+    return float(np.sqrt(np.mean(errors ** 2)))
 
 def write_comparison_csv(filepath: str, data: List[dict]):
     """將觀測與預測的比較結果寫入 CSV 檔案。"""
@@ -312,6 +475,9 @@ def plot_comparison_results(timestamps: List[datetime.datetime], observed: List[
     """
     將觀測值與預測值繪製成圖表。
     """
+    # matplotlib 載入成本高，延後到真正需要繪圖時才匯入
+    import matplotlib.pyplot as plt
+
     # 嘗試設定支援中文的字體
     try:
         # Windows 使用 'Microsoft JhengHei', macOS 使用 'Heiti TC', Linux 可能需安裝 'wqy-zenhei'
@@ -397,6 +563,11 @@ if __name__ == "__main__":
         default="1486",
         help="報告中的測站代碼 (預設: 1486)"
     )
+    parser.add_argument(
+        '--no_text_report',
+        action='store_true',
+        help="不產生年度文字報表 (僅需 --compare/--plot 結果時可加速)"
+    )
     parser.add_argument(
         '--compare',
         action='store_true',
@@ -432,16 +603,20 @@ if __name__ == "__main__":
     full_report_data = report_generator.generate_hourly_report(args.year)
     print("預報資料產生完成。")
 
-    print("正在產生年度報表...")
-    annual_report_string = report_generator.print_annual_stage_report(
-        full_report_data, 
-        args.year, 
-        args.station_name, 
-        args.station_code
-    )
-    print("報表產生完成。")
+    # 僅需比較/繪圖結果時，可用 --no_text_report 跳過文字報表的產製
+    if args.no_text_report:
+        print("已略過年度文字報表。")
+    else:
+        print("正在產生年度報表...")
+        annual_report_string = report_generator.print_annual_stage_report(
+            full_report_data,
+            args.year,
+            args.station_name,
+            args.station_code
+        )
+        print("報表產生完成。")
 
-    output_to_text_file(args.year, annual_report_string, args.output_dir)
+        output_to_text_file(args.year, annual_report_string, args.output_dir)
 
     # 如果指定了比較選項，則執行比較和 RMSE 計算
     if args.compare:
@@ -455,34 +630,40 @@ if __name__ == "__main__":
         print(f"\n正在讀取觀測資料進行比較: {args.obs_file}")
         observations = read_observations(args.obs_file)
         
-        # 建立一個字典以便快速查找預測值
-        predicted_map = {}
-        start_date = datetime.datetime(args.year, 1, 1)
-        for day_idx, daily_data in enumerate(full_report_data):
-            for hour_idx, value in enumerate(daily_data):
-                current_time = start_date + datetime.timedelta(days=day_idx, hours=hour_idx)
-                predicted_map[current_time] = value
+        # 預測矩陣攤平成全年逐時向量，作為內插用的取樣網格
+        predicted_flat = full_report_data.ravel()
+
+        # 觀測時間一次轉成 datetime64，以向量化運算取代逐筆 timedelta 換算
+        obs_times = np.array([obs['time'] for obs in observations], dtype='datetime64[s]')
+        obs_values = np.array([obs['value'] for obs in observations], dtype=np.float64)
+        year_start = np.datetime64(f'{args.year:04d}-01-01', 's')
+        obs_hours = (obs_times - year_start).astype(np.int64) / 3600.0
+
+        # 保留落在預測年份內的觀測；非整點取樣以線性內插對齊逐時網格，
+        # 潮汐時間尺度下內插誤差可忽略，卻不會丟棄分鐘級的觀測資料
+        valid = (obs_hours >= 0.0) & (obs_hours <= predicted_flat.size - 1.0)
+
+        timestamps_for_plot = [obs['time'] for obs, ok in zip(observations, valid) if ok]
+        observed_values = obs_values[valid]
+        predicted_values_for_rmse = np.interp(
+            obs_hours[valid],
+            np.arange(predicted_flat.size, dtype=np.float64),
+            predicted_flat)
+
+        # RMSE 維持 float64 計算；繪圖與 CSV 輸出僅需約 4 位有效數字，
+        # 降為 float32 可減半長序列的記憶體流量
+        observed_f32 = observed_values.astype(np.float32)
+        predicted_f32 = predicted_values_for_rmse.astype(np.float32)
 
         # 準備用於 CSV 和 RMSE 計算的資料
-        comparison_data = []
-        observed_values = []
-        predicted_values_for_rmse = []
-        timestamps_for_plot = []
-
-        for obs in observations:
-            obs_time = obs['time']
-            # 檢查觀測時間是否在預測年份內
-            if obs_time.year == args.year:
-                predicted_value = predicted_map.get(obs_time)
-                if predicted_value is not None:
-                    timestamps_for_plot.append(obs_time)
-                    comparison_data.append({
-                        'time': obs_time.strftime('%Y-%m-%d %H:%M:%S'),
-                        'observed': obs['value'],
-                        'predicted': predicted_value
-                    })
-                    observed_values.append(obs['value'])
-                    predicted_values_for_rmse.append(predicted_value)
+        comparison_data = [
+            {
+                'time': ts.strftime('%Y-%m-%d %H:%M:%S'),
+                'observed': o,
+                'predicted': p
+            }
+            for ts, o, p in zip(timestamps_for_plot, observed_f32, predicted_f32)
+        ]
         
         if not comparison_data:
             print("警告: 觀測資料中沒有與預測年份相符的資料。")
@@ -508,8 +689,8 @@ if __name__ == "__main__":
                 plot_limit = args.limit if args.limit > 0 else None
                 plot_comparison_results(
                     timestamps=timestamps_for_plot,
-                    observed=observed_values,
-                    predicted=predicted_values_for_rmse,
+                    observed=observed_f32,
+                    predicted=predicted_f32,
                     obs_year=args.year,
                     param_year=report_generator.tide.tp.param_year,
                     station_name=args.station_name,